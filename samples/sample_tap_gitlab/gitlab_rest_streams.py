@@ -4,6 +4,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, cast
 
 import requests
+from memoization import cached
 
 from singer_sdk.authenticators import SimpleAuthenticator
 from singer_sdk.streams.rest import RESTStream
@@ -32,6 +33,7 @@ class GitlabStream(RESTStream):
         return self.config.get("api_url", DEFAULT_URL_BASE)
 
     @property
+    @cached
     def authenticator(self) -> SimpleAuthenticator:
         """Return an authenticator for REST API requests."""
         return SimpleAuthenticator(
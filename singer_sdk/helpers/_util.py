@@ -1,11 +1,31 @@
 """General helper functions, helper classes, and decorators."""
 
 import json
+from functools import lru_cache
 from pathlib import Path, PurePath
 from typing import Any, Dict, Union, cast
 
 import pendulum
 
+try:
+    import orjson
+except ImportError:
+    # Optional speedup. The standard library is used if not installed.
+    orjson = None  # type: ignore
+
+_MAX_SCHEMA_FILE_CACHE = 256  # Max number of schema files to keep the text of
+
+
+def parse_json(data: Union[str, bytes]) -> Any:
+    """Parse JSON text, using `orjson` if available."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # E.g. integers beyond 64 bits, which only the standard library supports.
+            pass
+    return json.loads(data)
+
 
 def read_json_file(path: Union[PurePath, str]) -> Dict[str, Any]:
     """Read json file, thowing an error if missing."""
@@ -19,7 +39,22 @@ def read_json_file(path: Union[PurePath, str]) -> Dict[str, Any]:
                 msg += f"\nFor more info, please see the sample template at: {template}"
         raise FileExistsError(msg)
 
-    return cast(dict, json.loads(Path(path).read_text()))
+    return cast(dict, parse_json(Path(path).read_bytes()))
+
+
+@lru_cache(maxsize=_MAX_SCHEMA_FILE_CACHE)
+def _read_schema_file_text(path: str) -> str:
+    """Read and cache the text of a JSON Schema file shipped with a plugin."""
+    return Path(path).read_text()
+
+
+def read_schema_file(path: Union[PurePath, str]) -> Dict[str, Any]:
+    """Read a JSON Schema file, reading from disk only once per process.
+
+    A new dict is parsed on each call, since callers may mutate the schema. This is
+    several times cheaper than deep-copying a cached dict.
+    """
+    return cast(dict, parse_json(_read_schema_file_text(str(path))))
 
 
 def utc_now() -> pendulum.DateTime:
@@ -2,10 +2,12 @@
 
 import abc
 import datetime
+import functools
+import json
 import time
 from logging import Logger
 from types import MappingProxyType
-from typing import Any, Dict, List, Mapping, Optional, Union
+from typing import Any, Callable, Dict, List, Mapping, Optional, Set, Union
 
 from dateutil import parser
 from jsonschema import Draft4Validator, FormatChecker
@@ -20,6 +22,110 @@ from singer_sdk.plugin_base import PluginBase
 
 JSONSchemaValidator = Draft4Validator
 
+# Max number of compiled validators of each kind to keep, keyed by schema JSON text.
+_MAX_LRU_CACHE = 100
+
+
+def _get_schema_validator(schema: Dict) -> Draft4Validator:
+    """Return a record validator for the schema, reusing a cached one if possible.
+
+    Sinks are re-created whenever a stream's schema changes, and taps commonly
+    re-send identical SCHEMA messages. Caching by schema content avoids compiling
+    a new validator for each of these.
+
+    Args:
+        schema: JSON Schema used to validate records.
+
+    Returns:
+        A validator instance for the provided schema.
+    """
+    return _compile_schema_validator(json.dumps(schema, sort_keys=True))
+
+
+@functools.lru_cache(maxsize=_MAX_LRU_CACHE)
+def _compile_schema_validator(schema_text: str) -> Draft4Validator:
+    """Return a record validator for the schema JSON text.
+
+    Args:
+        schema_text: JSON Schema used to validate records, as canonical JSON text.
+
+    Returns:
+        A validator instance for the provided schema.
+    """
+    # Validate against a private copy, since callers may mutate their schema.
+    return JSONSchemaValidator(json.loads(schema_text), format_checker=FormatChecker())
+
+
+def _get_fastjsonschema_validator(schema: Dict) -> Optional[Callable[[Dict], Any]]:
+    """Return a generated validation function for the schema, if available.
+
+    Requires the optional `fastjsonschema` package, which compiles each schema into
+    a specialized Python function. Compiled functions are cached by schema content.
+
+    Args:
+        schema: JSON Schema used to validate records.
+
+    Returns:
+        A validation function, or `None` if `fastjsonschema` is not installed.
+    """
+    return _compile_fastjsonschema_validator(json.dumps(schema, sort_keys=True))
+
+
+@functools.lru_cache(maxsize=_MAX_LRU_CACHE)
+def _compile_fastjsonschema_validator(
+    schema_text: str,
+) -> Optional[Callable[[Dict], Any]]:
+    """Return a generated validation function for the schema JSON text, if available.
+
+    Args:
+        schema_text: JSON Schema used to validate records, as canonical JSON text.
+
+    Returns:
+        A validation function, or `None` if `fastjsonschema` is not installed.
+    """
+    try:
+        import fastjsonschema
+    except ImportError:
+        return None
+
+    definition = json.loads(schema_text)
+    # Match the Draft 4 rules of the default `jsonschema` validator.
+    definition["$schema"] = "http://json-schema.org/draft-04/schema#"
+    # Check formats with the same functions as `jsonschema`, so that formats it
+    # does not check (e.g. `date-time` without `rfc3339-validator`) are not
+    # checked here either.
+    format_checker = FormatChecker()
+    formats = {
+        name: functools.partial(format_checker.conforms, format=name)
+        for name in _get_schema_formats(definition)
+    }
+    # Don't fill in defaults, which would mutate incoming records.
+    validate_fn: Callable[[Dict], Any] = fastjsonschema.compile(
+        definition, formats=formats, use_default=False
+    )
+    return validate_fn
+
+
+def _get_schema_formats(schema: object) -> Set[str]:
+    """Return the names of all string formats used in a JSON schema.
+
+    Args:
+        schema: JSON Schema, or any node within it.
+
+    Returns:
+        The `format` values found in the schema.
+    """
+    formats: Set[str] = set()
+    if isinstance(schema, dict):
+        if isinstance(schema.get("format"), str):
+            formats.add(schema["format"])
+        for value in schema.values():
+            formats.update(_get_schema_formats(value))
+    elif isinstance(schema, list):
+        for value in schema:
+            formats.update(_get_schema_formats(value))
+    return formats
+
 
 class Sink(metaclass=abc.ABCMeta):
     """Abstract base class for target sinks."""
@@ -30,6 +136,13 @@ class Sink(metaclass=abc.ABCMeta):
 
     MAX_SIZE_DEFAULT = 10000
 
+    #: Set to `True` to validate records with code generated by `fastjsonschema`,
+    #: falling back to `jsonschema` if the package is not installed. Install it with
+    #: the `fastjsonschema` extra, e.g. `pip install singer-sdk[fastjsonschema]`.
+    #: Records are validated with the same Draft 4 rules and format checks, but
+    #: validation failures raise `fastjsonschema.JsonSchemaException`.
+    use_fastjsonschema: bool = False
+
     def __init__(
         self,
         target: PluginBase,
@@ -69,7 +182,17 @@ class Sink(metaclass=abc.ABCMeta):
         self._batch_records_read: int = 0
         self._batch_dupe_records_merged: int = 0
 
-        self._validator = Draft4Validator(schema, format_checker=FormatChecker())
+        self._validator = _get_schema_validator(self.schema)
+        self._validate_record: Callable[[Dict], Any] = self._validator.validate
+        if self.use_fastjsonschema:
+            validate_fn = _get_fastjsonschema_validator(self.schema)
+            if validate_fn is None:
+                self.logger.warning(
+                    "Package 'fastjsonschema' is not installed. "
+                    "Falling back to 'jsonschema' for record validation."
+                )
+            else:
+                self._validate_record = validate_fn
 
     def _get_context(self, record: dict) -> dict:
         """Return an empty dictionary by default.
@@ -269,7 +392,7 @@ class Sink(metaclass=abc.ABCMeta):
         Returns:
             TODO
         """
-        self._validator.validate(record)
+        self._validate_record(record)
         self._parse_timestamps_in_record(
             record=record, schema=self.schema, treatment=self.datetime_error_treatment
         )
@@ -3,8 +3,8 @@
 import abc
 import copy
 import datetime
-import json
 import logging
+import threading
 from os import PathLike
 from pathlib import Path
 from types import MappingProxyType
@@ -52,7 +52,7 @@ from singer_sdk.helpers._state import (
     write_starting_replication_value,
 )
 from singer_sdk.helpers._typing import conform_record_data_types, is_datetime_type
-from singer_sdk.helpers._util import utc_now
+from singer_sdk.helpers._util import read_schema_file, utc_now
 from singer_sdk.mapper import RemoveRecordTransform, SameRecordTransform, StreamMap
 from singer_sdk.plugin_base import PluginBase as TapBaseClass
 
@@ -65,6 +65,14 @@ FactoryType = TypeVar("FactoryType", bound="Stream")
 
 METRICS_LOG_LEVEL_SETTING = "metrics_log_level"
 
+# Serializes writes to STDOUT when multiple streams are synced in parallel.
+_MESSAGE_LOCK = threading.Lock()
+
+# Guards changes to the shared tap state, and its serialization in STATE messages,
+# when multiple streams are synced in parallel. If both locks are needed, this one
+# must be acquired first.
+_STATE_LOCK = threading.RLock()
+
 
 class Stream(metaclass=abc.ABCMeta):
     """Abstract base class for tap streams."""
@@ -132,7 +140,7 @@ class Stream(metaclass=abc.ABCMeta):
                 )
 
         if self.schema_filepath:
-            self._schema = json.loads(Path(self.schema_filepath).read_text())
+            self._schema = read_schema_file(self.schema_filepath)
 
         if not self.schema:
             raise ValueError(
@@ -298,8 +306,9 @@ class Stream(metaclass=abc.ABCMeta):
         if not value:
             return
 
-        state = self.get_context_state(context)
-        write_replication_key_signpost(state, value)
+        with _STATE_LOCK:
+            state = self.get_context_state(context)
+            write_replication_key_signpost(state, value)
 
     def _write_starting_replication_value(self, context: Optional[dict]) -> None:
         """Write the starting replication value, if available.
@@ -308,19 +317,20 @@ class Stream(metaclass=abc.ABCMeta):
             context: Stream partition or context dictionary.
         """
         value = None
-        state = self.get_context_state(context)
+        with _STATE_LOCK:
+            state = self.get_context_state(context)
 
-        if self.replication_key:
-            replication_key_value = state.get("replication_key_value")
-            if replication_key_value and self.replication_key == state.get(
-                "replication_key"
-            ):
-                value = replication_key_value
+            if self.replication_key:
+                replication_key_value = state.get("replication_key_value")
+                if replication_key_value and self.replication_key == state.get(
+                    "replication_key"
+                ):
+                    value = replication_key_value
 
-            elif "start_date" in self.config:
-                value = self.config["start_date"]
+                elif "start_date" in self.config:
+                    value = self.config["start_date"]
 
-        write_starting_replication_value(state, value)
+            write_starting_replication_value(state, value)
 
     def get_replication_key_signpost(
         self, context: Optional[dict]
@@ -592,11 +602,12 @@ class Stream(metaclass=abc.ABCMeta):
         """
         state_partition_context = self._get_state_partition_context(context)
         if state_partition_context:
-            return get_writeable_state_dict(
-                self.tap_state,
-                self.name,
-                state_partition_context=state_partition_context,
-            )
+            with _STATE_LOCK:
+                return get_writeable_state_dict(
+                    self.tap_state,
+                    self.name,
+                    state_partition_context=state_partition_context,
+                )
         return self.stream_state
 
     @property
@@ -616,7 +627,8 @@ class Stream(metaclass=abc.ABCMeta):
         Returns:
             A writable state dict for this stream.
         """
-        return get_writeable_state_dict(self.tap_state, self.name)
+        with _STATE_LOCK:
+            return get_writeable_state_dict(self.tap_state, self.name)
 
     # Partitions
 
@@ -642,7 +654,11 @@ class Stream(metaclass=abc.ABCMeta):
     # Private bookmarking methods
 
     def _increment_stream_state(
-        self, latest_record: Dict[str, Any], *, context: Optional[dict] = None
+        self,
+        latest_record: Dict[str, Any],
+        *,
+        context: Optional[dict] = None,
+        state_dict: Optional[dict] = None,
     ) -> None:
         """Update state of stream or partition with data from the provided record.
 
@@ -652,37 +668,46 @@ class Stream(metaclass=abc.ABCMeta):
         Args:
             latest_record: TODO
             context: Stream partition or context dictionary.
+            state_dict: The writable state for `context`, if already known. Otherwise
+                it is looked up (or created) in the tap state.
 
         Raises:
             ValueError: TODO
         """
-        state_dict = self.get_context_state(context)
-        if latest_record:
-            if self.replication_method in [
-                REPLICATION_INCREMENTAL,
-                REPLICATION_LOG_BASED,
-            ]:
-                if not self.replication_key:
-                    raise ValueError(
-                        f"Could not detect replication key for '{self.name}' stream"
-                        f"(replication method={self.replication_method})"
-                    )
-                treat_as_sorted = self.is_sorted
-                if not treat_as_sorted and self.state_partitioning_keys is not None:
-                    # Streams with custom state partitioning are not resumable.
-                    treat_as_sorted = False
-                increment_state(
-                    state_dict,
-                    replication_key=self.replication_key,
-                    latest_record=latest_record,
-                    is_sorted=treat_as_sorted,
-                )
+        if not latest_record:
+            return
+
+        # Called once per record, so each property is read only once.
+        replication_method = self.replication_method
+        if replication_method not in (REPLICATION_INCREMENTAL, REPLICATION_LOG_BASED):
+            return
+
+        replication_key = self.replication_key
+        if not replication_key:
+            raise ValueError(
+                f"Could not detect replication key for '{self.name}' stream"
+                f"(replication method={replication_method})"
+            )
+        treat_as_sorted = self.is_sorted
+        if not treat_as_sorted and self.state_partitioning_keys is not None:
+            # Streams with custom state partitioning are not resumable.
+            treat_as_sorted = False
+        with _STATE_LOCK:
+            if state_dict is None:
+                state_dict = self.get_context_state(context)
+            increment_state(
+                state_dict,
+                replication_key=replication_key,
+                latest_record=latest_record,
+                is_sorted=treat_as_sorted,
+            )
 
     # Private message authoring methods:
 
     def _write_state_message(self) -> None:
         """Write out a STATE message with the latest state."""
-        singer.write_message(StateMessage(value=self.tap_state))
+        with _STATE_LOCK, _MESSAGE_LOCK:
+            singer.write_message(StateMessage(value=self.tap_state))
 
     def _generate_schema_messages(self) -> Generator[SchemaMessage, None, None]:
         """Generate schema messages from stream maps.
@@ -707,7 +732,8 @@ class Stream(metaclass=abc.ABCMeta):
     def _write_schema_message(self) -> None:
         """Write out a SCHEMA message with the stream schema."""
         for schema_message in self._generate_schema_messages():
-            singer.write_message(schema_message)
+            with _MESSAGE_LOCK:
+                singer.write_message(schema_message)
 
     @property
     def mask(self) -> SelectionMask:
@@ -760,7 +786,8 @@ class Stream(metaclass=abc.ABCMeta):
             record: A single stream record.
         """
         for record_message in self._generate_record_messages(record):
-            singer.write_message(record_message)
+            with _MESSAGE_LOCK:
+                singer.write_message(record_message)
 
     @property
     def _metric_logging_function(self) -> Optional[Callable]:
@@ -882,15 +909,16 @@ class Stream(metaclass=abc.ABCMeta):
         Args:
             state: State object to promote progress markers with.
         """
-        if state is None or state == {}:
-            context: Optional[dict]
-            for context in self.partitions or [{}]:
-                context = context or None
-                state = self.get_context_state(context)
-                reset_state_progress_markers(state)
-            return
+        with _STATE_LOCK:
+            if state is None or state == {}:
+                context: Optional[dict]
+                for context in self.partitions or [{}]:
+                    context = context or None
+                    state = self.get_context_state(context)
+                    reset_state_progress_markers(state)
+                return
 
-        reset_state_progress_markers(state)
+            reset_state_progress_markers(state)
 
     def finalize_state_progress_markers(self, state: Optional[dict] = None) -> None:
         """Reset progress markers. If all=True, all state contexts will be finalized.
@@ -902,28 +930,34 @@ class Stream(metaclass=abc.ABCMeta):
         Args:
             state: State object to promote progress markers with.
         """
-        if state is None or state == {}:
-            for child_stream in self.child_streams or []:
-                child_stream.finalize_state_progress_markers()
-
-            context: Optional[dict]
-            for context in self.partitions or [{}]:
-                context = context or None
-                state = self.get_context_state(context)
-                finalize_state_progress_markers(state)
-            return
+        with _STATE_LOCK:
+            if state is None or state == {}:
+                for child_stream in self.child_streams or []:
+                    child_stream.finalize_state_progress_markers()
+
+                context: Optional[dict]
+                for context in self.partitions or [{}]:
+                    context = context or None
+                    state = self.get_context_state(context)
+                    finalize_state_progress_markers(state)
+                return
 
-        finalize_state_progress_markers(state)
+            finalize_state_progress_markers(state)
 
     # Private sync methods:
 
     def _sync_records(  # noqa C901  # too complex
-        self, context: Optional[dict] = None
+        self,
+        context: Optional[dict] = None,
+        *,
+        partitions: Optional[List[dict]] = None,
     ) -> None:
         """Sync records, emitting RECORD and STATE messages.
 
         Args:
             context: Stream partition or context dictionary.
+            partitions: Partitions to sync if `context` is not set, if already
+                evaluated. Defaults to `self.partitions`.
 
         Raises:
             InvalidStreamSortException: TODO
@@ -931,8 +965,15 @@ class Stream(metaclass=abc.ABCMeta):
         record_count = 0
         current_context: Optional[dict]
         context_list: Optional[List[dict]]
-        context_list = [context] if context is not None else self.partitions
+        if context is not None:
+            context_list = [context]
+        elif partitions is not None:
+            context_list = partitions
+        else:
+            context_list = self.partitions
         selected = self.selected
+        primary_stream_map = self.stream_maps[0]
+        state_msg_frequency = self.STATE_MSG_FREQUENCY
 
         for current_context in context_list or [{}]:
             partition_record_count = 0
@@ -958,15 +999,17 @@ class Stream(metaclass=abc.ABCMeta):
                         record[key] = val
 
                 # Sync children, except when primary mapper filters out the record
-                if self.stream_maps[0].get_filter_result(record):
+                if primary_stream_map.get_filter_result(record):
                     self._sync_children(child_context)
                 self._check_max_record_limit(record_count)
                 if selected:
-                    if (record_count - 1) % self.STATE_MSG_FREQUENCY == 0:
+                    if (record_count - 1) % state_msg_frequency == 0:
                         self._write_state_message()
                     self._write_record_message(record)
                     try:
-                        self._increment_stream_state(record, context=current_context)
+                        self._increment_stream_state(
+                            record, context=current_context, state_dict=state
+                        )
                     except InvalidStreamSortException as ex:
                         log_sort_error(
                             log_fn=self.logger.error,
@@ -983,11 +1026,13 @@ class Stream(metaclass=abc.ABCMeta):
                 partition_record_count += 1
             if current_context == state_partition_context:
                 # Finalize per-partition state only if 1:1 with context
-                finalize_state_progress_markers(state)
+                with _STATE_LOCK:
+                    finalize_state_progress_markers(state)
         if not context:
             # Finalize total stream only if we have the full full context.
             # Otherwise will be finalized by tap at end of sync.
-            finalize_state_progress_markers(self.stream_state)
+            with _STATE_LOCK:
+                finalize_state_progress_markers(self.stream_state)
         self._write_record_count_log(record_count=record_count, context=context)
         # Reset interim bookmarks before emitting final STATE message:
         self._write_state_message()
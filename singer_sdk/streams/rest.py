@@ -3,16 +3,25 @@
 import abc
 import copy
 import logging
+import queue
+import re
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from typing import (
     Any,
     Callable,
+    Deque,
     Dict,
     Generator,
     Generic,
     Iterable,
+    Iterator,
     List,
     Optional,
+    Tuple,
     TypeVar,
     Union,
 )
@@ -29,10 +38,27 @@ from singer_sdk.streams.core import Stream
 
 DEFAULT_PAGE_SIZE = 1000
 DEFAULT_REQUEST_TIMEOUT = 300  # 5 minutes
+PREFETCH_BUFFER_SIZE = 1000  # Max records held in memory per prefetched partition
+
+# Sentinel marking the end of a prefetched partition's records.
+_PREFETCH_DONE = object()
 
 _TToken = TypeVar("_TToken")
 
 
+@lru_cache(maxsize=256)
+def _get_url_template_fields(url_template: str) -> Tuple[str, ...]:
+    """Get the distinct ``{field}`` placeholder names in a URL template.
+
+    Args:
+        url_template: The unformatted URL, e.g. ``https://api.com/{project_id}/items``.
+
+    Returns:
+        The placeholder names, in order of first appearance.
+    """
+    return tuple(dict.fromkeys(re.findall(r"{([^{}]+)}", url_template)))
+
+
 class RESTStream(Stream, Generic[_TToken], metaclass=abc.ABCMeta):
     """Abstract base class for REST API streams."""
 
@@ -50,6 +76,12 @@ class RESTStream(Stream, Generic[_TToken], metaclass=abc.ABCMeta):
     #: Example: `"$.next_page"`
     next_page_token_jsonpath: Optional[str] = None
 
+    #: Max number of partitions to request concurrently. When greater than 1, records
+    #: for upcoming partitions are requested in background threads while earlier
+    #: partitions are being synced. Only enable this if `request_records()` and the
+    #: methods it calls are thread-safe.
+    max_concurrent_partitions: int = 1
+
     # Private constants. May not be supported in future releases:
     _LOG_REQUEST_METRICS: bool = True
     # Disabled by default for safety:
@@ -80,9 +112,13 @@ class RESTStream(Stream, Generic[_TToken], metaclass=abc.ABCMeta):
         if path:
             self.path = path
         self._http_headers: dict = {}
-        self._requests_session = requests.Session()
+        self._requests_session = self._new_requests_session()
         self._compiled_jsonpath = None
         self._next_page_token_compiled_jsonpath = None
+        self._prefetched_partitions: Deque[
+            Tuple[Optional[dict], Iterator[dict]]
+        ] = deque()
+        self._prefetch_consumer_thread: Optional[int] = None
 
     @staticmethod
     def _url_encode(val: Union[str, datetime, bool, int, List[str]]) -> str:
@@ -112,12 +148,16 @@ class RESTStream(Stream, Generic[_TToken], metaclass=abc.ABCMeta):
             A URL, optionally targeted to a specific partition or context.
         """
         url = "".join([self.url_base, self.path or ""])
-        vals = copy.copy(dict(self.config))
-        vals.update(context or {})
-        for k, v in vals.items():
-            search_text = "".join(["{", k, "}"])
-            if search_text in url:
-                url = url.replace(search_text, self._url_encode(v))
+        config = self.config
+        context = context or {}
+        for field_name in _get_url_template_fields(url):
+            if field_name in context:
+                val = context[field_name]
+            elif field_name in config:
+                val = config[field_name]
+            else:
+                continue
+            url = url.replace("".join(["{", field_name, "}"]), self._url_encode(val))
         return url
 
     # HTTP Request functions
@@ -133,9 +173,22 @@ class RESTStream(Stream, Generic[_TToken], metaclass=abc.ABCMeta):
             https://docs.python-requests.org/en/latest/api/#request-sessions
         """
         if not self._requests_session:
-            self._requests_session = requests.Session()
+            self._requests_session = self._new_requests_session()
         return self._requests_session
 
+    def _new_requests_session(self) -> requests.Session:
+        """Create a requests session using the tap's shared connection pool.
+
+        Returns:
+            A new `requests.Session`_ object.
+        """
+        session = requests.Session()
+        http_adapter = getattr(self._tap, "http_adapter", None)
+        if http_adapter is not None:
+            session.mount("https://", http_adapter)
+            session.mount("http://", http_adapter)
+        return session
+
     def validate_response(self, response: requests.Response) -> None:
         """Validate HTTP response.
 
@@ -321,6 +374,11 @@ class RESTStream(Stream, Generic[_TToken], metaclass=abc.ABCMeta):
             RuntimeError: If a loop in pagination is detected. That is, when two
                 consecutive pagination tokens are identical.
         """
+        prefetched = self._pop_prefetched_records(context)
+        if prefetched is not None:
+            yield from prefetched
+            return
+
         next_page_token: Optional[_TToken] = None
         finished = False
         decorated_request = self.request_decorator(self._request)
@@ -343,6 +401,126 @@ class RESTStream(Stream, Generic[_TToken], metaclass=abc.ABCMeta):
             # Cycle until get_next_page_token() no longer returns a value
             finished = not next_page_token
 
+    # Concurrent partition requests
+
+    def _sync_records(
+        self,
+        context: Optional[dict] = None,
+        *,
+        partitions: Optional[List[dict]] = None,
+    ) -> None:
+        """Sync records, requesting partitions concurrently if enabled.
+
+        Args:
+            context: Stream partition or context dictionary.
+            partitions: Partitions to sync if `context` is not set, if already
+                evaluated. Defaults to `self.partitions`.
+        """
+        if self.max_concurrent_partitions <= 1 or context is not None:
+            super()._sync_records(context, partitions=partitions)
+            return
+
+        if partitions is None:
+            partitions = self.partitions or []
+        if len(partitions) < 2:
+            super()._sync_records(context, partitions=partitions)
+            return
+
+        stop_event = threading.Event()
+        self._prefetch_consumer_thread = threading.get_ident()
+        with ThreadPoolExecutor(max_workers=self.max_concurrent_partitions) as pool:
+            for partition in partitions:
+                partition_context = partition or None
+                # Starting values must be in state before any request is prepared.
+                self._write_starting_replication_value(partition_context)
+                buffer: queue.Queue = queue.Queue(maxsize=PREFETCH_BUFFER_SIZE)
+                future = pool.submit(
+                    self._prefetch_records, partition_context, buffer, stop_event
+                )
+                self._prefetched_partitions.append(
+                    (partition_context, self._iter_prefetched(buffer, future))
+                )
+            try:
+                # Sync the same partition dicts which are being prefetched.
+                super()._sync_records(context, partitions=partitions)
+            finally:
+                stop_event.set()
+                self._prefetched_partitions.clear()
+                self._prefetch_consumer_thread = None
+
+    def _prefetch_records(
+        self,
+        context: Optional[dict],
+        buffer: queue.Queue,
+        stop_event: threading.Event,
+    ) -> None:
+        """Request records for a partition, passing them to the consuming thread.
+
+        Args:
+            context: Stream partition or context dictionary.
+            buffer: Queue to hold requested records until they are synced.
+            stop_event: Set by the consuming thread to abort the request.
+        """
+
+        def put(item: object) -> bool:
+            while not stop_event.is_set():
+                try:
+                    buffer.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        if stop_event.is_set():
+            return
+        try:
+            for record in self.request_records(context):
+                if not put(record):
+                    return
+        finally:
+            # Any error is re-raised to the consuming thread by the task's future.
+            put(_PREFETCH_DONE)
+
+    @staticmethod
+    def _iter_prefetched(buffer: queue.Queue, future: Future) -> Iterator[dict]:
+        """Yield prefetched records, then re-raise any error from the request thread.
+
+        Args:
+            buffer: Queue filled by `_prefetch_records()`.
+            future: The future of the `_prefetch_records()` task.
+
+        Yields:
+            One item for every record in the partition.
+        """
+        while True:
+            item = buffer.get()
+            if item is _PREFETCH_DONE:
+                future.result()
+                return
+            yield item
+
+    def _pop_prefetched_records(
+        self, context: Optional[dict]
+    ) -> Optional[Iterator[dict]]:
+        """Return the prefetched records for the context, if any.
+
+        Prefetched records are only handed to the syncing thread. The request threads
+        get `None`, so their `request_records()` calls send the actual requests.
+
+        Args:
+            context: Stream partition or context dictionary.
+
+        Returns:
+            An iterator of prefetched records, or `None` if they must be requested.
+        """
+        if (
+            threading.get_ident() == self._prefetch_consumer_thread
+            and self._prefetched_partitions
+            and self._prefetched_partitions[0][0] == context
+        ):
+            return self._prefetched_partitions.popleft()[1]
+        return None
+
     # Overridable:
 
     def prepare_request_payload(
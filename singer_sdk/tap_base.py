@@ -2,11 +2,15 @@
 
 import abc
 import json
+import sys
+import textwrap
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from enum import Enum
 from pathlib import Path, PurePath
-from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union, cast
+from typing import IO, Any, Callable, Dict, List, Optional, Tuple, Type, Union, cast
 
 import click
+from requests.adapters import HTTPAdapter
 
 from singer_sdk.cli import common_options
 from singer_sdk.exceptions import MaxRecordsLimitException
@@ -27,6 +31,10 @@ from singer_sdk.streams import SQLStream, Stream
 
 STREAM_MAPS_CONFIG = "stream_maps"
 
+HTTP_POOL_CONNECTIONS = 16  # Number of distinct hosts to keep connection pools for
+HTTP_POOL_MAXSIZE = 32  # Max connections to keep open per host
+MAX_PARALLEL_STREAMS = 8  # Max streams synced at once when `parallel_sync` is set
+
 
 class CliTestOptionValue(Enum):
     """Values for CLI option --test."""
@@ -43,6 +51,11 @@ class Tap(PluginBase, metaclass=abc.ABCMeta):
     plugins.
     """
 
+    #: Set to `True` to sync independent (top-level) streams concurrently in a thread
+    #: pool. Child streams are still synced by their parent. Only enable this if the
+    #: tap's streams are thread-safe.
+    parallel_sync: bool = False
+
     # Constructor
 
     def __init__(
@@ -76,6 +89,9 @@ class Tap(PluginBase, metaclass=abc.ABCMeta):
         self._input_catalog: Optional[Catalog] = None
         self._state: Dict[str, Stream] = {}
         self._catalog: Optional[Catalog] = None  # Tap's working catalog
+        self._discovered_catalog: Optional[Catalog] = None
+        self._catalog_json_text: Optional[str] = None
+        self._http_adapter: Optional[HTTPAdapter] = None
 
         # Process input catalog
         if isinstance(catalog, Catalog):
@@ -117,6 +133,7 @@ class Tap(PluginBase, metaclass=abc.ABCMeta):
 
         if self._streams is None:
             self._streams = {}
+            self._reset_catalog_cache()
             for stream in self.load_streams():
                 if input_catalog is not None:
                     stream.apply_catalog(input_catalog)
@@ -158,6 +175,24 @@ class Tap(PluginBase, metaclass=abc.ABCMeta):
 
         return self._catalog
 
+    @property
+    def http_adapter(self) -> HTTPAdapter:
+        """Get the HTTP transport adapter shared by the tap's REST streams.
+
+        Streams mount this adapter on their own sessions so that pooled connections,
+        and the TCP and TLS handshakes needed to open them, are reused across all
+        streams and partitions during a sync.
+
+        Returns:
+            A `requests` HTTP adapter with connection pooling.
+        """
+        if self._http_adapter is None:
+            self._http_adapter = HTTPAdapter(
+                pool_connections=HTTP_POOL_CONNECTIONS,
+                pool_maxsize=HTTP_POOL_MAXSIZE,
+            )
+        return self._http_adapter
+
     @classproperty
     def capabilities(self) -> List[CapabilitiesEnum]:
         """Get tap capabilities.
@@ -183,11 +218,12 @@ class Tap(PluginBase, metaclass=abc.ABCMeta):
         Returns:
             True if the test succeeded.
         """
-        for stream in self.streams.values():
+        streams = self.streams.values()
+        for stream in streams:
             # Initialize streams' record limits before beginning the sync test.
             stream._MAX_RECORDS_LIMIT = 1
 
-        for stream in self.streams.values():
+        for stream in streams:
             if stream.parent_stream_type:
                 self.logger.debug(
                     f"Child stream '{type(stream).__name__}' should be called by "
@@ -215,10 +251,61 @@ class Tap(PluginBase, metaclass=abc.ABCMeta):
         Returns:
             The catalog as a string of JSON.
         """
-        catalog_text = self.catalog_json_text
-        print(catalog_text)
+        # Keep the text from `catalog_json_text` (or an override of it) so that
+        # `write_catalog()` writes the same text that is returned here.
+        catalog_text = self._catalog_json_text = self.catalog_json_text
+        self.write_catalog()
         return catalog_text
 
+    def write_catalog(self, out: Optional[IO[str]] = None) -> None:
+        """Write the catalog json to STDOUT.
+
+        If the catalog text has not been built yet, `catalog_dict` is serialized and
+        written one stream entry at a time instead of building the text of the full
+        catalog first. The output is identical.
+
+        Args:
+            out: Text stream to write to. Defaults to STDOUT.
+        """
+        out = out or sys.stdout
+        if self._catalog_json_text is not None:
+            out.write(f"{self._catalog_json_text}\n")
+            out.flush()
+            return
+
+        # Match the layout of `json.dumps(self.catalog_dict, indent=2)`:
+        out.write("{")
+        item_separator = "\n"
+        for key, value in self.catalog_dict.items():
+            out.write(f"{item_separator}  {json.dumps(key)}: ")
+            if key == "streams" and isinstance(value, list) and value:
+                separator = "[\n"
+                for entry in value:
+                    entry_text = json.dumps(entry, indent=2)
+                    out.write(separator + textwrap.indent(entry_text, "    "))
+                    separator = ",\n"
+                out.write("\n  ]")
+            else:
+                out.write(json.dumps(value, indent=2).replace("\n", "\n  "))
+            item_separator = ",\n"
+        out.write("}\n" if item_separator == "\n" else "\n}\n")
+        out.flush()
+
+    def _write_discovered_catalog(self) -> None:
+        """Write the catalog json to STDOUT for the `--discover` CLI option.
+
+        The catalog is streamed with `write_catalog()` unless `run_discovery()` or
+        `catalog_json_text` are overridden, in which case `run_discovery()` is used.
+        """
+        tap_class = type(self)
+        if (
+            tap_class.run_discovery is Tap.run_discovery
+            and tap_class.catalog_json_text is Tap.catalog_json_text
+        ):
+            self.write_catalog()
+        else:
+            self.run_discovery()
+
     @property
     def catalog_dict(self) -> dict:
         """Get catalog dictionary.
@@ -232,22 +319,35 @@ class Tap(PluginBase, metaclass=abc.ABCMeta):
     def catalog_json_text(self) -> str:
         """Get catalog JSON.
 
+        Results will be cached after first execution.
+
         Returns:
             The tap's catalog as formatted JSON text.
         """
-        return json.dumps(self.catalog_dict, indent=2)
+        if self._catalog_json_text is None:
+            self._catalog_json_text = json.dumps(self.catalog_dict, indent=2)
+        return self._catalog_json_text
 
     @property
     def _singer_catalog(self) -> Catalog:
         """Return a Catalog object.
 
+        Results will be cached after first execution.
+
         Returns:
             :class:`singer_sdk.helpers._singer.Catalog`.
         """
-        return Catalog(
-            (stream.tap_stream_id, stream._singer_catalog_entry)
-            for stream in self.streams.values()
-        )
+        if self._discovered_catalog is None:
+            self._discovered_catalog = Catalog(
+                (stream.tap_stream_id, stream._singer_catalog_entry)
+                for stream in self.streams.values()
+            )
+        return self._discovered_catalog
+
+    def _reset_catalog_cache(self) -> None:
+        """Clear the cached catalog, e.g. after streams are (re)initialized."""
+        self._discovered_catalog = None
+        self._catalog_json_text = None
 
     def discover_streams(self) -> List[Stream]:
         """Initialize all available streams and return them as a list.
@@ -354,6 +454,7 @@ class Tap(PluginBase, metaclass=abc.ABCMeta):
                     )
                     stream.replication_key = None
                     stream.forced_replication_method = "FULL_TABLE"
+                    self._reset_catalog_cache()
 
     # Sync methods
 
@@ -363,6 +464,7 @@ class Tap(PluginBase, metaclass=abc.ABCMeta):
         self._reset_state_progress_markers()
         self._set_compatible_replication_methods()
         stream: "Stream"
+        streams: List[Stream] = []
         for stream in self.streams.values():
             if not stream.selected and not stream.has_selected_descendents:
                 self.logger.info(f"Skipping deselected stream '{stream.name}'.")
@@ -376,8 +478,51 @@ class Tap(PluginBase, metaclass=abc.ABCMeta):
                 )
                 continue
 
-            stream.sync()
-            stream.finalize_state_progress_markers()
+            streams.append(stream)
+
+        try:
+            if self.parallel_sync and len(streams) > 1:
+                self._sync_streams_in_parallel(streams)
+            else:
+                for stream in streams:
+                    self._sync_stream(stream)
+        finally:
+            if self._http_adapter is not None:
+                self._http_adapter.close()
+
+    @staticmethod
+    def _sync_stream(stream: Stream) -> None:
+        """Sync a top-level stream and its descendents, then finalize their state.
+
+        Args:
+            stream: The stream to sync.
+        """
+        stream.sync()
+        stream.finalize_state_progress_markers()
+
+    def _sync_streams_in_parallel(self, streams: List[Stream]) -> None:
+        """Sync independent streams concurrently.
+
+        Args:
+            streams: The top-level streams to sync.
+
+        Raises:
+            Exception: The first error raised while syncing a stream.
+        """
+        max_workers = min(MAX_PARALLEL_STREAMS, len(streams))
+        self.logger.info(
+            f"Syncing {len(streams)} streams with {max_workers} parallel workers."
+        )
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = [pool.submit(self._sync_stream, stream) for stream in streams]
+            try:
+                for future in as_completed(futures):
+                    future.result()
+            except Exception:
+                # Don't start any further streams after a failure.
+                for future in futures:
+                    future.cancel()
+                raise
 
     # Command Line Execution
 
@@ -490,7 +635,7 @@ class Tap(PluginBase, metaclass=abc.ABCMeta):
             )
 
             if discover:
-                tap.run_discovery()
+                tap._write_discovered_catalog()
                 if test == CliTestOptionValue.All.value:
                     tap.run_connection_test()
             elif test == CliTestOptionValue.All.value:
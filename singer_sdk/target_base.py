@@ -10,7 +10,6 @@ from pathlib import Path, PurePath
 from typing import IO, Callable, Counter, Dict, List, Optional, Tuple, Type, Union
 
 import click
-from joblib import Parallel, delayed, parallel_backend
 
 from singer_sdk.cli import common_options
 from singer_sdk.exceptions import RecordsWitoutSchemaException
@@ -437,6 +436,10 @@ class Target(PluginBase, SingerReader, metaclass=abc.ABCMeta):
                 self.drain_one(sink)
             return
 
+        # Imported here since joblib (and numpy) are slow to import and only needed
+        # for parallel draining.
+        from joblib import Parallel, delayed, parallel_backend
+
         def _drain_sink(sink: Sink) -> None:
             self.drain_one(sink)
 
@@ -0,0 +1,123 @@
+"""Tests for concurrent partition requests in REST streams."""
+
+from typing import Iterable, List, Optional
+
+import pytest
+import requests_mock
+
+from singer_sdk.exceptions import FatalAPIError
+from singer_sdk.streams import RESTStream
+from singer_sdk.tap_base import Tap
+
+
+class PartitionedStream(RESTStream):
+    """A REST stream with one partition per item group."""
+
+    name = "partitioned"
+    url_base = "https://example.com"
+    path = "/groups/{group_id}/items"
+    schema = {
+        "type": "object",
+        "properties": {
+            "id": {"type": "integer"},
+            "group_id": {"type": "integer"},
+        },
+    }
+
+    partitions_evaluated = 0
+
+    @property
+    def partitions(self) -> Optional[List[dict]]:
+        """Return one partition per group, as new dicts on every call."""
+        self.partitions_evaluated += 1
+        return [{"group_id": group_id} for group_id in range(5)]
+
+
+class PartitionedTap(Tap):
+    """A tap with a partitioned REST stream."""
+
+    name = "partitioned-tap"
+
+    def discover_streams(self) -> List[RESTStream]:
+        """Get collection of streams."""
+        return [PartitionedStream(self)]
+
+
+@pytest.fixture
+def stream() -> PartitionedStream:
+    """Get a partitioned REST stream."""
+    return PartitionedTap().streams["partitioned"]
+
+
+@pytest.mark.parametrize("max_concurrent_partitions", [1, 3])
+def test_partition_records_order(
+    stream: PartitionedStream,
+    requests_mock: requests_mock.Mocker,
+    max_concurrent_partitions: int,
+):
+    """Records are synced in partition order, whether or not prefetched."""
+    for group_id in range(5):
+        requests_mock.get(
+            f"https://example.com/groups/{group_id}/items",
+            json=[{"id": group_id * 10 + i} for i in range(3)],
+        )
+
+    stream.max_concurrent_partitions = max_concurrent_partitions
+    synced: List[dict] = []
+    stream._write_record_message = synced.append  # type: ignore[assignment]
+    stream.sync()
+
+    assert [record["id"] for record in synced] == [
+        group_id * 10 + i for group_id in range(5) for i in range(3)
+    ]
+    assert [record["group_id"] for record in synced] == [
+        group_id for group_id in range(5) for _ in range(3)
+    ]
+    assert not stream._prefetched_partitions
+    assert stream.partitions_evaluated == 1
+    assert requests_mock.call_count == 5
+
+
+def test_partition_request_error(
+    stream: PartitionedStream, requests_mock: requests_mock.Mocker
+):
+    """Errors raised while prefetching are re-raised in the syncing thread."""
+    for group_id in range(5):
+        requests_mock.get(
+            f"https://example.com/groups/{group_id}/items",
+            json=[{"id": group_id}],
+            status_code=404 if group_id == 2 else 200,
+        )
+
+    stream.max_concurrent_partitions = 3
+    stream._write_record_message = lambda record: None  # type: ignore[assignment]
+    with pytest.raises(FatalAPIError, match="404 Client Error"):
+        stream.sync()
+
+
+def test_partition_records_get_records_override(requests_mock: requests_mock.Mocker):
+    """Prefetched records are used when `get_records()` calls `request_records()`."""
+
+    class OverrideStream(PartitionedStream):
+        def get_records(self, context: Optional[dict]) -> Iterable[dict]:
+            for record in self.request_records(context):
+                yield {**record, "group_id": context["group_id"] if context else None}
+
+    class OverrideTap(PartitionedTap):
+        def discover_streams(self) -> List[RESTStream]:
+            return [OverrideStream(self)]
+
+    for group_id in range(5):
+        requests_mock.get(
+            f"https://example.com/groups/{group_id}/items",
+            json=[{"id": group_id}],
+        )
+
+    stream = OverrideTap().streams["partitioned"]
+    stream.max_concurrent_partitions = 3
+    synced: List[dict] = []
+    stream._write_record_message = synced.append  # type: ignore[assignment]
+    stream.sync()
+
+    assert [record["id"] for record in synced] == list(range(5))
+    assert requests_mock.call_count == 5
@@ -1,5 +1,7 @@
 """Stream tests."""
 
+import io
+import json
 from typing import Any, Dict, Iterable, List, Optional, cast
 
 import pendulum
@@ -7,6 +9,7 @@ import pytest
 import requests
 
 from singer_sdk.helpers._classproperty import classproperty
+from singer_sdk.helpers._util import read_schema_file
 from singer_sdk.helpers.jsonpath import _compile_jsonpath
 from singer_sdk.streams.core import (
     REPLICATION_FULL_TABLE,
@@ -357,3 +360,214 @@ def test_cached_jsonpath():
 
     # cached objects should point to the same memory location
     assert recompiled is compiled
+
+
+def test_cached_catalog(tap: SimpleTestTap):
+    """Test the discovered catalog and its JSON text are cached."""
+    catalog_text = tap.catalog_json_text
+    assert tap.catalog_json_text is catalog_text
+    assert tap._singer_catalog is tap._singer_catalog
+    assert json.loads(catalog_text) == tap.catalog_dict
+
+
+def test_catalog_json_text_format():
+    """Test catalog text is formatted like `json.dumps(..., indent=2)`."""
+
+    class FormatTestStream(CountingTestStream):
+        name = "format_test"
+        schema = {
+            "type": "object",
+            "properties": {"café": {"type": "number", "multipleOf": 0.00001}},
+        }
+
+    class FormatTestTap(Tap):
+        name = "format-test-tap"
+
+        def discover_streams(self) -> List[Stream]:
+            return [FormatTestStream(self)]
+
+    format_tap = FormatTestTap()
+    assert format_tap.catalog_json_text == json.dumps(format_tap.catalog_dict, indent=2)
+    assert '"caf\\u00e9"' in format_tap.catalog_json_text
+    assert "1e-05" in format_tap.catalog_json_text
+
+
+def test_shared_http_adapter(tap: SimpleTestTap):
+    """Test REST streams reuse the tap's pooled HTTP adapter."""
+    stream = RestTestStream(tap)
+    other_stream = GraphqlTestStream(tap)
+    assert stream.requests_session is not other_stream.requests_session
+    assert stream.requests_session.get_adapter("https://example.com") is (
+        other_stream.requests_session.get_adapter("https://example.com")
+    )
+    assert stream.requests_session.get_adapter("https://example.com") is (
+        tap.http_adapter
+    )
+
+
+def test_get_url(tap: SimpleTestTap):
+    """Test URL placeholders are filled from the context, then the config."""
+    stream = RestTestStream(tap, path="/{start_date}/{group}/{group}/{unknown}")
+    url = stream.get_url({"group": "a/b", "start_date": "2022-01-01"})
+    assert url == "https://example.com/2022-01-01/a%2Fb/a%2Fb/{unknown}"
+    url = stream.get_url(None)
+    assert url == "https://example.com/2021-01-01/{group}/{group}/{unknown}"
+
+
+class CountingTestStream(Stream):
+    """Test stream which emits a fixed number of records."""
+
+    schema = PropertiesList(Property("id", IntegerType, required=True)).to_dict()
+
+    def get_records(self, context: Optional[dict]) -> Iterable[Dict[str, Any]]:
+        """Generate records."""
+        for i in range(100):
+            yield {"id": i}
+
+
+class ParallelTestTap(Tap):
+    """Test tap class which syncs its streams in parallel."""
+
+    name = "parallel-test-tap"
+    parallel_sync = True
+
+    def discover_streams(self) -> List[Stream]:
+        """List all streams."""
+        schema = CountingTestStream.schema
+        return [
+            CountingTestStream(self, name=f"stream_{i}", schema=schema)
+            for i in range(4)
+        ]
+
+
+def test_parallel_sync(capsys: pytest.CaptureFixture):
+    """Test all streams are synced when syncing in parallel."""
+    tap = ParallelTestTap()
+    tap.sync_all()
+
+    messages = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    for i in range(4):
+        records = [
+            message
+            for message in messages
+            if message["type"] == "RECORD" and message["stream"] == f"stream_{i}"
+        ]
+        assert [record["record"]["id"] for record in records] == list(range(100))
+    assert messages[-1]["type"] == "STATE"
+    assert set(messages[-1]["value"]["bookmarks"]) == {f"stream_{i}" for i in range(4)}
+
+
+class PartitionedCountingTestStream(CountingTestStream):
+    """Test stream which updates partition bookmarks and writes frequent STATE."""
+
+    replication_key = "id"
+    STATE_MSG_FREQUENCY = 7
+
+    @property
+    def partitions(self) -> Optional[List[dict]]:
+        """Return stream partitions."""
+        return [{"partition": i} for i in range(5)]
+
+
+class ParallelIncrementalTestTap(Tap):
+    """Test tap class which syncs partitioned incremental streams in parallel."""
+
+    name = "parallel-incremental-test-tap"
+    parallel_sync = True
+
+    def discover_streams(self) -> List[Stream]:
+        """List all streams."""
+        schema = PartitionedCountingTestStream.schema
+        return [
+            PartitionedCountingTestStream(self, name=f"stream_{i}", schema=schema)
+            for i in range(4)
+        ]
+
+
+def test_parallel_sync_state(capsys: pytest.CaptureFixture):
+    """Test partition state is complete when streams are synced in parallel."""
+    tap = ParallelIncrementalTestTap()
+    tap.sync_all()
+
+    messages = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    bookmarks = messages[-1]["value"]["bookmarks"]
+    assert set(bookmarks) == {f"stream_{i}" for i in range(4)}
+    for stream_state in bookmarks.values():
+        assert stream_state["partitions"] == [
+            {
+                "context": {"partition": i},
+                "replication_key": "id",
+                "replication_key_value": 99,
+            }
+            for i in range(5)
+        ]
+
+
+def test_write_catalog(tap: SimpleTestTap):
+    """Test the catalog written entry by entry matches the full catalog text."""
+    out = io.StringIO()
+    tap.write_catalog(out)
+    assert tap._catalog_json_text is None
+    assert out.getvalue() == f"{tap.catalog_json_text}\n"
+
+    class EmptyTestTap(Tap):
+        name = "empty-test-tap"
+
+        def discover_streams(self) -> List[Stream]:
+            return []
+
+    empty_tap = EmptyTestTap()
+    out = io.StringIO()
+    empty_tap.write_catalog(out)
+    assert json.loads(out.getvalue()) == {"streams": []}
+    assert out.getvalue() == f"{empty_tap.catalog_json_text}\n"
+
+    class OverrideTestTap(SimpleTestTap):
+        @property
+        def catalog_dict(self) -> dict:
+            return {
+                "version": 1,
+                "streams": [{"tap_stream_id": "overridden", "metadata": []}],
+                "extra": {"nested": [1, 2]},
+            }
+
+    override_tap = OverrideTestTap(config={"start_date": "2021-01-01"})
+    out = io.StringIO()
+    override_tap.write_catalog(out)
+    assert out.getvalue() == f"{override_tap.catalog_json_text}\n"
+
+
+def test_run_discovery(tap: SimpleTestTap, capsys):
+    """Test run_discovery writes and returns the catalog text."""
+    catalog_text = tap.run_discovery()
+    assert capsys.readouterr().out == f"{catalog_text}\n"
+    assert catalog_text == tap.catalog_json_text
+
+
+def test_write_discovered_catalog(tap: SimpleTestTap, capsys):
+    """Test --discover streams the catalog unless the catalog text is overridden."""
+    tap._write_discovered_catalog()
+    assert tap._catalog_json_text is None
+    assert capsys.readouterr().out == f"{tap.catalog_json_text}\n"
+
+    class TextOverrideTestTap(SimpleTestTap):
+        @property
+        def catalog_json_text(self) -> str:
+            return '{"streams": []}'
+
+    override_tap = TextOverrideTestTap(config={"start_date": "2021-01-01"})
+    override_tap._write_discovered_catalog()
+    assert capsys.readouterr().out == '{"streams": []}\n'
+
+
+def test_read_schema_file(tmp_path):
+    """Test schema files are read once and parsed into a new dict on every call."""
+    schema_path = tmp_path / "schema.json"
+    schema_path.write_text('{"properties": {"id": {"type": "integer"}}}')
+
+    schema = read_schema_file(schema_path)
+    schema["properties"]["name"] = {"type": "string"}
+    schema_path.write_text('{"properties": {}}')
+
+    assert read_schema_file(schema_path) == {"properties": {"id": {"type": "integer"}}}
+    assert read_schema_file(schema_path) is not read_schema_file(schema_path)
@@ -1,8 +1,63 @@
 """Test class creation."""
 
+import pytest
+
 from samples.sample_target_csv.csv_target import SampleTargetCSV
+from samples.sample_target_csv.csv_target_sink import SampleCSVTargetSink
 
 
 def test_target_class(csv_config: dict):
     """Test class creation."""
     _ = SampleTargetCSV(config=csv_config)
+
+
+def test_sink_validator_reuse(csv_config: dict):
+    """Test that sinks with identical schemas share a compiled validator."""
+    target = SampleTargetCSV(config=csv_config)
+    schema = {
+        "type": "object",
+        "properties": {"id": {"type": "integer"}, "name": {"type": "string"}},
+    }
+    sink_a = target.add_sink("users", dict(schema), ["id"])
+    sink_b = target.add_sink("users_copy", dict(schema), ["id"])
+    assert sink_a._validator is sink_b._validator
+
+    other_schema = {"type": "object", "properties": {"id": {"type": "string"}}}
+    sink_c = target.add_sink("others", other_schema, ["id"])
+    assert sink_c._validator is not sink_a._validator
+
+
+def test_sink_fastjsonschema_validation(csv_config: dict, monkeypatch):
+    """Test record validation with the optional fastjsonschema backend."""
+    fastjsonschema = pytest.importorskip("fastjsonschema")
+    monkeypatch.setattr(SampleCSVTargetSink, "use_fastjsonschema", True)
+    target = SampleTargetCSV(config=csv_config)
+    schema = {"type": "object", "properties": {"id": {"type": "integer"}}}
+    sink = target.add_sink("fast_users", schema, ["id"])
+
+    assert sink._validate_and_parse({"id": 1}) == {"id": 1}
+    with pytest.raises(fastjsonschema.JsonSchemaException):
+        sink._validate_and_parse({"id": "not-an-integer"})
+
+
+@pytest.mark.parametrize(
+    "value",
+    ["2022-01-01T00:00:00Z", "2022-01-01 00:00:00", "not-an-email", "127.0.0.1"],
+)
+@pytest.mark.parametrize("format", ["date-time", "email", "ipv4"])
+def test_sink_fastjsonschema_formats(csv_config: dict, monkeypatch, format, value):
+    """Test both validation backends accept the same formatted values."""
+    fastjsonschema = pytest.importorskip("fastjsonschema")
+    schema = {"type": "object", "properties": {"value": {"format": format}}}
+    target = SampleTargetCSV(config=csv_config)
+    sink = target.add_sink("users", schema, [])
+    is_valid = sink._validator.is_valid({"value": value})
+
+    monkeypatch.setattr(SampleCSVTargetSink, "use_fastjsonschema", True)
+    fast_sink = target.add_sink("fast_users", schema, [])
+    try:
+        fast_sink._validate_and_parse({"value": value})
+    except fastjsonschema.JsonSchemaException:
+        assert not is_valid
+    else:
+        assert is_valid